@@ -78,11 +78,69 @@ This module provides the class that allows browsing extracted poker hands data i
 ########################################################
 """
 
-from textwrap import dedent
+import sys
 from typing import Optional
 
 from extract import VALID_GAME_TYPES, PokerHandsExtractor
 
+# templates built once at import so the render loop only pays for .format
+_PSTR_TMPL = """
+###   total_bet : {:<34} ###
+###    bankroll : {:<34} ###
+###        bets : {}
+###      pocket : {:<34} ###
+###   total_win : {:<34} ###
+"""
+_HANDSTR_TMPL = """\
+#    time : {}   hand# : {:<15} #
+#   board : {:<42} #
+#    pots : {:<42} #
+# players :                                            #
+"""
+_SEP = "# {}.#\n".format(". " * 26)
+
+
+def _render_hand(hand: dict, hand_num: int) -> str:
+    """Render a hand record into its bordered console block
+
+    Args:
+        hand (dict): hand record in json
+        hand_num (int): running number displayed in the hand header
+
+    Returns:
+        str: rendered block, newline-terminated
+    """
+    timestamp = hand["_id"].split("_", 1)[1]
+    pots = [(p["num_players"], p["size"]) for p in hand["pots"]]
+    playerstr = []
+    players = hand["players"]
+    assert len(players) == hand["num_players"], (len(players), hand["num_players"])
+    seats = sorted((p["position"], n) for n, p in players.items())
+    for i, (_, name) in enumerate(seats):
+        player = players[name]
+        frags = [f"{{'actions': {b['actions']!r}, 'stage': {b['stage']!r}}}" for b in player["bets"]]
+        bets = ["{:<34} ###".format("[" + frags[0] + ",")]
+        for frag in frags[1:-1]:
+            bets.append("###" + " " * 16 + f"{frag[:-1]:<33} ###")
+        bets.append("###" + " " * 16 + f"{frags[-1] + ']':<33} ###")
+        betstr = "\n".join(bets)
+        pstr = f"# {name + ' (#' + str(i + 1) + ')':^52} #" + _PSTR_TMPL.format(
+            player["total_bet"],
+            player["bankroll"],
+            betstr,
+            str(player["pocket_cards"]),
+            player["total_win"],
+        )
+        playerstr.append(pstr)
+    playerstr = _SEP.join(playerstr)
+    handstr = _HANDSTR_TMPL.format(
+        timestamp,
+        hand_num,
+        str(hand["board"]),
+        str(pots),
+    )
+    return "#" * 56 + "\n" + handstr + playerstr + "#" * 56 + "\n"
+
 
 class PokerHandsBrowser:
     def __init__(self, fname: str):
@@ -102,62 +160,30 @@ class PokerHandsBrowser:
             manual_mode (bool): set to true to go to the next hand only when ENTER is pressed
         """
         assert (not game_type) or (game_type in VALID_GAME_TYPES)
-        extractor = PokerHandsExtractor(fname_out=self.fname)
+        extractor = PokerHandsExtractor(fname_out=self.fname, game_type=game_type)
         hand_counter = 0
+        out = sys.stdout.buffer
+        buf = bytearray()
         for hand in extractor:
-            if game_type and (not hand["_id"].startswith(game_type)):
-                continue
             try:
-                timestamp = hand["_id"].split("_", 1)[1]
-                pots = [(p["num_players"], p["size"]) for p in hand["pots"]]
-                playerstr = []
-                players = hand["players"]
-                pos = [v["position"] for _, v in players.items()]
-                assert len(pos) == hand["num_players"], (pos, hand["num_players"])
-                for i, name in enumerate(sorted(players, key=lambda x: players[x]["position"])):
-                    player = players[name]
-                    bets = str(player["bets"]).split("}, ")
-                    bets[0] = "{:<34} ###".format(bets[0] + "},")
-                    for j in range(1, len(bets)):
-                        bets[j] = "###" + " " * 16 + f"{bets[j]:<33} ###"
-                    betstr = "\n".join(bets)
-                    pstr = (
-                        f"# {name + ' (#' + str(i + 1) + ')':^52} #"
-                        + dedent("""
-                        ###   total_bet : {:<34} ###
-                        ###    bankroll : {:<34} ###
-                        ###        bets : {}
-                        ###      pocket : {:<34} ###
-                        ###   total_win : {:<34} ###
-                        """).format(
-                            player["total_bet"],
-                            player["bankroll"],
-                            betstr,
-                            str(player["pocket_cards"]),
-                            player["total_win"],
-                        )
-                    )
-                    playerstr.append(pstr)
-                playerstr = ("# {}.#\n".format(". " * 26)).join(playerstr)
-                handstr = dedent("""
-                #    time : {}   hand# : {:<15} #
-                #   board : {:<42} #
-                #    pots : {:<42} #
-                # players :                                            #
-                """[1:-1]).format(
-                    timestamp,
-                    hand_counter,
-                    str(hand["board"]),
-                    str(pots),
-                )
-                print("#" * 56 + "\n" + handstr + playerstr + "#" * 56)
+                buf += _render_hand(hand, hand_counter).encode()
                 hand_counter += 1
                 if manual_mode:
+                    out.write(buf)
+                    out.flush()
+                    buf.clear()
                     input()
                 else:
-                    print()
+                    buf += b"\n"
+                    if len(buf) > 65536:
+                        out.write(buf)
+                        out.flush()
+                        buf.clear()
             except KeyboardInterrupt:
                 break
+        if buf:
+            out.write(buf)
+            out.flush()
 
 
 if __name__ == "__main__":
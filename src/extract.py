@@ -195,15 +195,25 @@ The JSON record corresponding to the above example would be
     }
 """
 
+import gzip
 import json
 import os
+import re
+import sys
+from dataclasses import dataclass
 from functools import partial
+from io import BytesIO
 from multiprocessing.pool import Pool
 from tarfile import TarFile
-from typing import Annotated, Iterator, Optional
+from typing import Iterator, Optional
 
-import ijson
-from pydantic import BaseModel, Field, ValidationError
+import numpy as np
+
+try:
+    # the C-backed yajl2 backend parses an order of magnitude faster when libyajl is around
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    import ijson
 
 from utils import logger, system
 
@@ -219,97 +229,164 @@ VALID_GAME_TYPES = {
     "tourney",
 }
 SLASH = "\\" if system == "Windows" else "/"
-STAGES = ["preflop", "flop", "turn", "river", "showdown"]
-
-# a bunch of annotated types for validation
-Timestamp = Annotated[int, Field(ge=100000000, le=999999999)]
-Stage = Annotated[str, Field(pattern=r"^[0-9]+\/[0-9]+$")]
-Card = Annotated[str, Field(pattern=r"^[1-9,TJQKA][schd]$")]
-Action = Annotated[str, Field(pattern=r"^[BfkbcrAQK-]+$")]
-
 
-class HdbRecord(BaseModel):
-    timestamp: Timestamp
+# one compiled pattern parses and validates an entire line in a single match call, instead of
+# one check per column
+_HDB_LINE = re.compile(
+    r"^\s*(?P<timestamp>[1-9][0-9]{8})"
+    r"\s+(?P<dealer>\d+)"
+    r"\s+(?P<hand_num>\d+)"
+    r"\s+(?P<num_players>\d+)"
+    r"\s+(?P<flop>\d+/\d+)"
+    r"\s+(?P<turn>\d+/\d+)"
+    r"\s+(?P<river>\d+/\d+)"
+    r"\s+(?P<showdown>\d+/\d+)"
+    r"(?P<cards>(?:\s+[1-9,TJQKA][schd]){0,5})"
+    r"\s*$"
+)
+_PDB_LINE = re.compile(
+    r"^\s*(?P<player>\S+)"
+    r"\s+(?P<timestamp>[1-9][0-9]{8})"
+    r"\s+(?P<num_players>\d+)"
+    r"\s+(?P<position>\d+)"
+    r"\s+(?P<preflop>[BfkbcrAQK-]+)"
+    r"\s+(?P<flop>[BfkbcrAQK-]+)"
+    r"\s+(?P<turn>[BfkbcrAQK-]+)"
+    r"\s+(?P<river>[BfkbcrAQK-]+)"
+    r"\s+(?P<bankroll>-?\d+)"
+    r"\s+(?P<total_bet>-?\d+)"
+    r"\s+(?P<total_win>-?\d+)"
+    r"(?P<cards>(?:\s+[1-9,TJQKA][schd]){0,2})"
+    r"\s*$"
+)
+
+
+class ValidationError(ValueError):
+    """Raised when a line does not parse into a valid record"""
+
+
+def _parse_timestamp(raw: str) -> int:
+    timestamp = int(raw)
+    if not 100000000 <= timestamp <= 999999999:
+        raise ValidationError(f"Timestamp {timestamp} out of range")
+    return timestamp
+
+
+def _index_rows(lines: list[str], index: int) -> tuple[list[str], np.ndarray]:
+    """Collect the timestamp column of each line into a sorted int64 array, dropping lines whose
+    timestamp column does not hold a valid timestamp; lines are kept raw and parsed fully only
+    when a hand matches them
+
+    Args:
+        lines (list[str]): decoded lines of an hroster or pdb file
+        index (int): position of the timestamp column
+
+    Returns:
+        tuple[list[str], np.ndarray]: kept lines, and their timestamps for binary search
+    """
+    rows = []
+    stamps = []
+    for line in lines:
+        fields = line.split(None, index + 1)
+        if index < len(fields):
+            stamp = fields[index]
+            if stamp.isdigit() and 100000000 <= int(stamp) <= 999999999:
+                rows.append(line)
+                stamps.append(int(stamp))
+    return rows, np.array(stamps, dtype=np.int64)
+
+
+@dataclass(slots=True, frozen=True, init=False)
+class HdbRecord:
+    timestamp: int
     dealer: int
     hand_num: int
     num_players: int
-    flop: Stage
-    turn: Stage
-    river: Stage
-    showdown: Stage
-    card1: Optional[Card] = None
-    card2: Optional[Card] = None
-    card3: Optional[Card] = None
-    card4: Optional[Card] = None
-    card5: Optional[Card] = None
-
-    def __init__(self, *args):
-        try:
-            super().__init__(**dict(zip(self.model_fields, args)))
-        except ValidationError:
-            msg = f"Validation error for HdbRecord: fields={tuple(self.model_fields)} args={args}"
+    flop: str
+    turn: str
+    river: str
+    showdown: str
+    cards: list[str]
+
+    def __init__(self, line: str):
+        match = _HDB_LINE.match(line)
+        if match is None:
+            msg = f"Validation error for HdbRecord: line={line!r}"
             logger.error(msg)
-            raise
-
-    @property
-    def cards(self):
-        cards = [self.card1, self.card2, self.card3, self.card4, self.card5]
-        return [c for c in cards if c is not None]
+            raise ValidationError(msg)
+        set_field = partial(object.__setattr__, self)
+        set_field("timestamp", int(match["timestamp"]))
+        set_field("dealer", int(match["dealer"]))
+        set_field("hand_num", int(match["hand_num"]))
+        set_field("num_players", int(match["num_players"]))
+        set_field("flop", match["flop"])
+        set_field("turn", match["turn"])
+        set_field("river", match["river"])
+        set_field("showdown", match["showdown"])
+        set_field("cards", match["cards"].split())
 
     @property
     def pots(self):
-        pots = []
-        for stage in STAGES[1:]:
-            n, s = getattr(self, stage).split("/")
-            pots.append({"num_players": int(n), "stage": stage[0], "size": int(s)})
-        return pots
+        flop = self.flop.partition("/")
+        turn = self.turn.partition("/")
+        river = self.river.partition("/")
+        showdown = self.showdown.partition("/")
+        return [
+            {"num_players": int(flop[0]), "stage": "f", "size": int(flop[2])},
+            {"num_players": int(turn[0]), "stage": "t", "size": int(turn[2])},
+            {"num_players": int(river[0]), "stage": "r", "size": int(river[2])},
+            {"num_players": int(showdown[0]), "stage": "s", "size": int(showdown[2])},
+        ]
 
 
-class HrosterRecord(BaseModel):
-    timestamp: Timestamp
+@dataclass(slots=True, frozen=True, init=False)
+class HrosterRecord:
+    timestamp: int
     num_players: int
     players: list[str]
 
     def __init__(self, *args):
         try:
-            super().__init__(timestamp=args[0], num_players=args[1], players=args[2:])
-        except ValidationError:
-            msg = f"Validation error for HrosterRecord: fields={tuple(self.model_fields)} args={args}"
+            if len(args) < 2:
+                raise ValidationError(f"Expected at least 2 fields, got {len(args)}")
+            set_field = partial(object.__setattr__, self)
+            set_field("timestamp", _parse_timestamp(args[0]))
+            set_field("num_players", int(args[1]))
+            set_field("players", [sys.intern(p) for p in args[2:]])
+        except ValueError as err:
+            msg = f"Validation error for HrosterRecord: args={args}"
             logger.error(msg)
-            raise
-
-
-class PdbRecord(BaseModel):
-    player: str
-    timestamp: Timestamp
-    num_players: int
-    position: int
-    preflop: Action
-    flop: Action
-    turn: Action
-    river: Action
-    bankroll: int
-    total_bet: int
-    total_win: int
-    card1: Optional[Card] = None
-    card2: Optional[Card] = None
-
-    def __init__(self, *args):
-        try:
-            super().__init__(**dict(zip(self.model_fields, args)))
-        except ValidationError:
-            msg = f"Validation error for PdbRecord: fields={tuple(self.model_fields)} args={args}"
-            logger.error(msg)
-            raise
-
-    @property
-    def cards(self):
-        cards = [self.card1, self.card2]
-        return [c for c in cards if c is not None]
-
-    @property
-    def bets(self):
-        return [{"actions": getattr(self, stage), "stage": stage[0]} for stage in STAGES[:-1]]
+            raise ValidationError(msg) from err
+
+
+def _parse_player(line: str) -> dict:
+    """Parse a pdb line straight into the per-player entry of a hand record; each matched row
+    is consumed exactly once, so no intermediate record object is built
+
+    Args:
+        line (str): raw pdb line
+
+    Returns:
+        dict: per-player entry as it appears under 'players' in a hand record
+    """
+    match = _PDB_LINE.match(line)
+    if match is None:
+        msg = f"Validation error for pdb record: line={line!r}"
+        logger.error(msg)
+        raise ValidationError(msg)
+    return {
+        "total_bet": int(match["total_bet"]),
+        "bankroll": int(match["bankroll"]),
+        "bets": [
+            {"actions": match["preflop"], "stage": "p"},
+            {"actions": match["flop"], "stage": "f"},
+            {"actions": match["turn"], "stage": "t"},
+            {"actions": match["river"], "stage": "r"},
+        ],
+        "pocket_cards": match["cards"].split(),
+        "position": int(match["position"]),
+        "total_win": int(match["total_win"]),
+    }
 
 
 class PokerHandsExtractor:
@@ -318,6 +395,7 @@ class PokerHandsExtractor:
         *,
         fname_in: Optional[str] = None,
         fname_out: Optional[str] = None,
+        game_type: Optional[str] = None,
         n_jobs: int = 1,
     ):
         """Extract poker hands data from an input file and optionally save to an output file
@@ -325,8 +403,13 @@ class PokerHandsExtractor:
         Args:
             fname_in (Optional[str]): input filepath
             fname_out (Optional[str]): output filepath
+            game_type (Optional[str]): only yield hands of this game type, default to None for all
             n_jobs (int): number of processes for extraction, default to 1, set to -1 to use all cores
         """
+        if game_type:
+            assert game_type in VALID_GAME_TYPES, f"Invalid game type {game_type}"
+        self.game_type = game_type
+
         if fname_in:
             assert fname_in.endswith(".tgz"), f"Input {fname_in} is not a tgz file"
             self.fname_in = fname_in
@@ -336,161 +419,153 @@ class PokerHandsExtractor:
             if os.path.isfile(fname_out) and n_jobs != 1:
                 msg = f"Parameter n_jobs={n_jobs} will be ignored since fname_out={fname_out} exists"
                 logger.warning(msg)
+            if game_type and not os.path.isfile(fname_out):
+                msg = f"Output fname_out={fname_out} will only contain game_type={game_type} hands"
+                logger.warning(msg)
         self.fname_out = fname_out
 
-        self.n_jobs = n_jobs if n_jobs > 0 else os.cpu_count()
+        if n_jobs > 0:
+            self.n_jobs = n_jobs
+        else:
+            try:
+                # respect cgroup/affinity limits, which cpu_count ignores on container hosts
+                self.n_jobs = len(os.sched_getaffinity(0))
+            except AttributeError:
+                self.n_jobs = os.cpu_count()
 
     @staticmethod
-    def _extract_single_group(name_group: str, fname_in: str) -> list[dict]:
-        """Given an input filepath and specific group name, extract all poker hands data within
+    def _extract_single_group(name_group: str, raw_group: bytes) -> list[dict]:
+        """Given a group name and the raw bytes of its tarball, extract all poker hands data within
 
         Args:
             name_group (str): name of the group
-            fname_in (str): input filepath
+            raw_group (bytes): gzipped bytes of the inner group tarball
 
         Returns:
             list[dict]: a list of hand records in json
         """
-        with TarFile.open(fname_in) as tar_in:
-            split = lambda x: x.decode().strip().split()
-            if not name_group.endswith(".tgz"):
-                return []
-            parts = name_group.rsplit(SLASH, 1)
-            if len(parts) < 2:
-                logger.error(f"Could not split {name_group} into two parts.")
-            else:
-                fname_group = parts[1]
-            game_type = fname_group.split(".", 1)[0]
-            if game_type not in VALID_GAME_TYPES:
-                return []
-            folder_group = fname_group.rstrip(".tgz").replace(".", SLASH)
-            file_group = tar_in.extractfile(name_group)
-            if file_group is None:
-                logger.error(f"File {fname_group} not found")
-                return []
-            logger.info(f"Extracting {fname_group}")
-            with TarFile.open(fileobj=file_group) as tar_group:
-                hands = []
-                fname_group = ""
-                try:
-                    # extract files
-                    file_hdb = file_hroster = None
-                    file_pdb = {}
-
-                    fname_hdb = f"{folder_group}{SLASH}hdb"
-                    file_hdb = tar_group.extractfile(fname_hdb)
-                    if not file_hdb:
-                        logger.error(f"File {fname_hdb} not found")
-                        return []
-                    iter_hdb = iter(file_hdb)
-                    logger.debug(f"File {fname_hdb} extracted")
-
-                    fname_hroster = f"{folder_group}{SLASH}hroster"
-                    file_hroster = tar_group.extractfile(fname_hroster)
-                    if not file_hroster:
-                        logger.error(f"File {fname_hroster} not found")
-                        file_hdb.close()
-                        return []
-                    iter_hroster = iter(file_hroster)
-                    logger.debug(f"File {fname_hroster} extracted")
-
-                    file_pdb = {}
-                    iter_pdb = {}
-                    delimiter = f"pdb{SLASH}pdb."
-                    for fname in tar_group.getnames():
-                        if delimiter in fname:
-                            player = fname.split(delimiter)[-1]
-                            file_pdb[player] = tar_group.extractfile(fname)
-                            if file_pdb is None:
-                                logger.error(f"File {fname} not found")
-                                continue
-                            iter_pdb[player] = iter(file_pdb[player])
-                    msg = f"File {folder_group}{SLASH}pdb extracted, {len(iter_pdb)} files in total"
-                    logger.debug(msg)
-
-                    # iterate through timestamps
-                    pdb = {k: PdbRecord(*[s for s in split(next(v)) if s]) for k, v in iter_pdb.items()}
-                    while True:
-                        try:
-                            hdb = HdbRecord(*[s for s in split(next(iter_hdb)) if s])
-                            while True:
-                                hroster = HrosterRecord(*[s for s in split(next(iter_hroster)) if s])
-                                if hroster.timestamp >= hdb.timestamp:
-                                    break
-                            if hdb.timestamp < hroster.timestamp:
-                                continue
-                            assert hdb.timestamp == hroster.timestamp
-                            assert hdb.num_players == hroster.num_players
-                            _id = f"{folder_group}{SLASH}{hdb.timestamp}".replace(SLASH, "_")
-
-                            pdb_curr = {}
-                            pdb_missing = False
-                            for player in hroster.players:
-                                if player not in pdb:
-                                    msg = f"Record pdb.{player} missing at timestamp {hdb.timestamp}, skipping {_id}"
-                                    logger.debug(msg)
-                                    pdb_missing = True
-                                    break
-                                while pdb[player].timestamp < hdb.timestamp:
-                                    pdb[player] = PdbRecord(*[s for s in split(next(iter_pdb[player])) if s])
-                                if pdb[player].timestamp > hdb.timestamp:
-                                    msg = f"Record pdb.{player} missing at timestamp {hdb.timestamp}, skipping {_id}"
-                                    logger.debug(msg)
-                                    pdb_missing = True
-                                    break
-                                pdb_curr[player] = pdb[player]
-                            if pdb_missing:
-                                continue
-                            assert len(hroster.players) == len(pdb_curr)
-                            assert all(v.timestamp == hdb.timestamp for v in pdb_curr.values())
-
-                            hand = {
-                                "_id": _id,
-                                "board": hdb.cards,
-                                "dealer": hdb.dealer,
-                                "game": game_type,
-                                "hand_num": hdb.hand_num,
-                                "num_players": hdb.num_players,
-                                "players": {
-                                    k: {
-                                        "total_bet": v.total_bet,
-                                        "bankroll": v.bankroll,
-                                        "bets": v.bets,
-                                        "pocket_cards": v.cards,
-                                        "position": v.position,
-                                        "total_win": v.total_win,
-                                    }
-                                    for k, v in pdb_curr.items()
-                                },
-                                "pots": hdb.pots,
-                            }
-                            logger.debug(f"Hand {_id} extracted")
-                            hands.append(hand)
-                        except ValidationError:
+        if not name_group.endswith(".tgz"):
+            return []
+        parts = name_group.rsplit(SLASH, 1)
+        if len(parts) < 2:
+            logger.error(f"Could not split {name_group} into two parts.")
+        else:
+            fname_group = parts[1]
+        game_type = sys.intern(fname_group.split(".", 1)[0])
+        if game_type not in VALID_GAME_TYPES:
+            return []
+        folder_group = fname_group.rstrip(".tgz").replace(".", SLASH)
+        logger.info(f"Extracting {fname_group}")
+        try:
+            # decompress the gzip layer in one shot so member reads below are plain memory
+            # slices instead of many small reads through a streamed GzipFile
+            file_group = BytesIO(gzip.decompress(raw_group))
+        except (EOFError, gzip.BadGzipFile) as err:
+            logger.error(f"Could not decompress {fname_group}: {err}")
+            return []
+        with TarFile.open(fileobj=file_group, mode="r:") as tar_group:
+            hands = []
+            fname_group = ""
+            try:
+                # dispatch every member in one linear scan over the tar, decoding each file in
+                # a single read; the per-group files are small enough to hold their lines at once
+                lines_hdb = None
+                rows_hroster = ts_hroster = None
+                rows_pdb = {}
+                ts_pdb = {}
+                fname_hdb = f"{folder_group}{SLASH}hdb"
+                fname_hroster = f"{folder_group}{SLASH}hroster"
+                pdb_prefix = f"{folder_group}{SLASH}pdb{SLASH}pdb."
+                for member in tar_group:
+                    file_member = tar_group.extractfile(member)
+                    if file_member is None:
+                        continue
+                    lines = file_member.read().decode("latin-1").splitlines()
+                    file_member.close()
+                    if member.name == fname_hdb:
+                        lines_hdb = lines
+                    elif member.name == fname_hroster:
+                        rows_hroster, ts_hroster = _index_rows(lines, 0)
+                    elif member.name.startswith(pdb_prefix):
+                        player = sys.intern(member.name[len(pdb_prefix) :])
+                        rows_pdb[player], ts_pdb[player] = _index_rows(lines, 1)
+                if lines_hdb is None:
+                    logger.error(f"File {fname_hdb} not found")
+                    return []
+                if rows_hroster is None:
+                    logger.error(f"File {fname_hroster} not found")
+                    return []
+                iter_hdb = iter(lines_hdb)
+                msg = f"File {folder_group}{SLASH}pdb extracted, {len(rows_pdb)} files in total"
+                logger.debug(msg)
+
+                # iterate through timestamps, joining hroster/pdb rows by binary search so
+                # records are only materialized for rows that actually belong to a hand
+                while True:
+                    try:
+                        hdb = HdbRecord(next(iter_hdb))
+                        idx = int(np.searchsorted(ts_hroster, hdb.timestamp))
+                        if idx == len(rows_hroster) or ts_hroster[idx] != hdb.timestamp:
+                            continue
+                        hroster = HrosterRecord(*rows_hroster[idx].split())
+                        assert hdb.num_players == hroster.num_players
+                        _id = f"{folder_group}{SLASH}{hdb.timestamp}".replace(SLASH, "_")
+
+                        pdb_curr = {}
+                        pdb_missing = False
+                        for player in hroster.players:
+                            rows_player = rows_pdb.get(player)
+                            if rows_player is None:
+                                msg = f"Record pdb.{player} missing at timestamp {hdb.timestamp}, skipping {_id}"
+                                logger.debug(msg)
+                                pdb_missing = True
+                                break
+                            idx = int(np.searchsorted(ts_pdb[player], hdb.timestamp))
+                            if idx == len(rows_player) or ts_pdb[player][idx] != hdb.timestamp:
+                                msg = f"Record pdb.{player} missing at timestamp {hdb.timestamp}, skipping {_id}"
+                                logger.debug(msg)
+                                pdb_missing = True
+                                break
+                            pdb_curr[player] = _parse_player(rows_player[idx])
+                        if pdb_missing:
                             continue
-                except EOFError:
-                    logger.error(f"EOFError, skipping {fname_group}")
-                except StopIteration:
-                    pass
-                finally:
-                    logger.debug(f"Closing all files for {folder_group}")
-                    for file in [file_group, file_hdb, file_hroster, *file_pdb.values()]:  # type: ignore
-                        if file is not None:
-                            file.close()
-                    return hands
+                        assert len(hroster.players) == len(pdb_curr)
+
+                        hand = {
+                            "_id": _id,
+                            "board": hdb.cards,
+                            "dealer": hdb.dealer,
+                            "game": game_type,
+                            "hand_num": hdb.hand_num,
+                            "num_players": hdb.num_players,
+                            "players": pdb_curr,
+                            "pots": hdb.pots,
+                        }
+                        logger.debug(f"Hand {_id} extracted")
+                        hands.append(hand)
+                    except ValidationError:
+                        continue
+            except EOFError:
+                logger.error(f"EOFError, skipping {fname_group}")
+            except StopIteration:
+                pass
+            finally:
+                logger.debug(f"Closing all files for {folder_group}")
+                file_group.close()
+                return hands
 
     @staticmethod
-    def _iter_helper(name_group: str, fname_in: str) -> tuple[list[dict], str]:
+    def _iter_helper(group: tuple[str, bytes]) -> tuple[list[dict], str]:
         """Helper function that extracts the hands and return with group name
 
         Args:
-            name_group (str): name of the group
-            fname_in (str): input filepath
+            group (tuple[str, bytes]): name of the group and the raw bytes of its tarball
 
         Returns:
             tuple[list[dict], str]: list of hand records, and group name
         """
-        hands_group = PokerHandsExtractor._extract_single_group(name_group, fname_in)
+        name_group, raw_group = group
+        hands_group = PokerHandsExtractor._extract_single_group(name_group, raw_group)
         return hands_group, name_group
 
     def __iter__(self) -> Iterator[dict]:
@@ -500,32 +575,68 @@ class PokerHandsExtractor:
             dict: hand record in json
         """
         if self.fname_out and os.path.isfile(self.fname_out):
-            with open(self.fname_out, "r") as f:
+            prefix = f"{self.game_type}_" if self.game_type else None
+            with open(self.fname_out, "rb") as f:
                 for hand in ijson.items(f, "item"):
+                    if prefix and not hand["_id"].startswith(prefix):
+                        continue
                     yield hand
 
         else:
-            hands = []
             num_hands = 0
-            func = partial(self._iter_helper, fname_in=self.fname_in)
             logger.info(f"Initializing poker hand data extraction from {self.fname_in}")
-            with TarFile.open(self.fname_in) as tar_in:
-                names = tar_in.getnames()
-            with Pool(self.n_jobs) as pool:
-                for hands_group, name_group in pool.imap(func, names):
-                    if not hands_group:
-                        continue
-                    hands += hands_group
-                    num_hands_group = len(hands_group)
-                    num_hands += num_hands_group
-                    msg = f"{num_hands_group} hands extracted from {name_group}, {num_hands} hands extracted by far"
-                    logger.info(msg)
-                    for hand in hands_group:
-                        yield hand
+            file_out = None
+            fname_tmp = None
             if self.fname_out:
-                logger.info(f"Saving to {self.fname_out}")
-                with open(self.fname_out, "w") as f:
-                    json.dump(hands, f)
+                logger.info(f"Streaming to {self.fname_out}")
+                # stream to a sibling temp file so an interrupted run never leaves a truncated
+                # hands file behind for the load path to trip over
+                fname_tmp = f"{self.fname_out}.tmp"
+                file_out = open(fname_tmp, "w")
+                file_out.write("[")
+            try:
+                with TarFile.open(self.fname_in) as tar_in:
+                    # invalid (or unrequested) game types are filtered here so no worker (or
+                    # read) is ever scheduled for them
+                    game_types = {self.game_type} if self.game_type else VALID_GAME_TYPES
+                    members = [
+                        m
+                        for m in tar_in.getmembers()
+                        if m.isfile()
+                        and m.name.endswith(".tgz")
+                        and m.name.rsplit(SLASH, 1)[-1].split(".", 1)[0] in game_types
+                    ]
+                    # no point spinning up more workers than there are groups to extract
+                    n_jobs = max(1, min(self.n_jobs, len(members)))
+                    with Pool(n_jobs, maxtasksperchild=4) as pool:
+                        # the parent reads each inner tarball once and ships bytes, so workers
+                        # never reopen and rescan the outer archive
+                        groups = ((m.name, tar_in.extractfile(m).read()) for m in members)
+                        for hands_group, name_group in pool.imap_unordered(self._iter_helper, groups, chunksize=1):
+                            if not hands_group:
+                                continue
+                            for hand in hands_group:
+                                if file_out:
+                                    if num_hands:
+                                        file_out.write(",\n")
+                                    file_out.write(json.dumps(hand))
+                                num_hands += 1
+                                yield hand
+                            msg = (
+                                f"{len(hands_group)} hands extracted from {name_group}, "
+                                f"{num_hands} hands extracted by far"
+                            )
+                            logger.info(msg)
+                if file_out:
+                    file_out.write("]")
+                    file_out.close()
+                    os.replace(fname_tmp, self.fname_out)
+                    file_out = None
+            finally:
+                # abandoned mid-extraction: discard the partial file instead of promoting it
+                if file_out:
+                    file_out.close()
+                    os.remove(fname_tmp)
 
 
 if __name__ == "__main__":